@@ -14,6 +14,18 @@ class Settings(BaseSettings):
     app_port: int = 8000
     debug: bool = True
 
+    # Connection admission and drain settings
+    max_concurrent_joins: int = 20
+    join_queue_timeout: float = 5.0
+    drain_grace_period: float = 2.0
+    reconnect_delay_min_ms: int = 1000
+    reconnect_delay_max_ms: int = 10000
+
+    # Heartbeat settings (seconds)
+    heartbeat_interval: float = 20.0
+    heartbeat_timeout: float = 60.0
+    heartbeat_send_timeout: float = 5.0
+
     # CORS settings
     allowed_origins: List[str] = [
         "http://localhost:3000",
@@ -1,6 +1,6 @@
 """Database initialization script."""
 from app.database.connection import Base, engine
-from app.models import Room
+from app.models import Room, RoomFile
 
 
 def init_db():
@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.routers import rooms, autocomplete, websocket
 from app.database.init_db import init_db
+from app.services.websocket_manager import manager
 import logging
 
 # Configure logging
@@ -48,6 +49,16 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
 
+    manager.start_reaper()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain WebSocket rooms if the server didn't already do so before closing sockets."""
+    logger.info("Shutting down application...")
+    await manager.stop_reaper()
+    await manager.drain()
+
 
 @app.get("/")
 async def root():
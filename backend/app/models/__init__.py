@@ -1,4 +1,5 @@
 """Models package."""
 from app.models.room import Room
+from app.models.room_file import RoomFile
 
-__all__ = ["Room"]
+__all__ = ["Room", "RoomFile"]
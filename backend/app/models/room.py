@@ -11,6 +11,8 @@ class Room(Base):
     __tablename__ = "rooms"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Legacy single-buffer code; only used to seed the first file of rooms
+    # created before multi-file workspaces. File contents live in RoomFile.
     code = Column(Text, default="# Start coding here...\n")
     language = Column(String, default="python")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
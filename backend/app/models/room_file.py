@@ -0,0 +1,23 @@
+"""Database models for files within a room."""
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database.connection import Base
+import uuid
+
+
+class RoomFile(Base):
+    """A single file in a room's workspace. Content is only loaded when the file is opened."""
+
+    __tablename__ = "room_files"
+    __table_args__ = (UniqueConstraint("room_id", "path", name="uq_room_files_room_path"),)
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    room_id = Column(String, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False, index=True)
+    path = Column(String, nullable=False)
+    language = Column(String, default="python")
+    content = Column(Text, default="")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<RoomFile(id={self.id}, room_id={self.room_id}, path={self.path})>"
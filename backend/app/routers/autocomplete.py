@@ -1,5 +1,6 @@
 """API routes for autocomplete functionality."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
 from app.schemas.room import AutocompleteRequest, AutocompleteResponse
 from app.services.autocomplete_service import AutocompleteService
 
@@ -19,3 +20,30 @@ async def get_autocomplete(request: AutocompleteRequest):
     Returns a mocked suggestion based on simple pattern matching.
     """
     return AutocompleteService.get_suggestion(request)
+
+
+@router.post("/stream")
+async def stream_autocomplete(request: AutocompleteRequest, http_request: Request):
+    """
+    Stream an autocomplete suggestion as Server-Sent Events.
+
+    Accepts the same body as POST /autocomplete. Each event is an
+    AutocompleteChunk carrying the next piece of suggestion text; the
+    last event has done=true. Closing the connection cancels generation.
+    """
+    async def event_stream():
+        chunks = AutocompleteService.stream_suggestion(request)
+        try:
+            async for chunk in chunks:
+                if await http_request.is_disconnected():
+                    break
+                yield f"data: {chunk.model_dump_json()}\n\n"
+        finally:
+            # Release the generator (and any backend work) right away
+            await chunks.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,9 +1,18 @@
 """API routes for room management."""
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from typing import List
 from app.database import get_db
-from app.schemas.room import RoomCreate, RoomResponse, RoomDetail
+from app.schemas.room import (
+    RoomCreate,
+    RoomResponse,
+    RoomDetail,
+    RoomFileCreate,
+    RoomFileInfo,
+    RoomFileDetail,
+)
 from app.services.room_service import RoomService
+from app.services.websocket_manager import manager
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
@@ -27,16 +36,89 @@ async def get_room(room_id: str, db: Session = Depends(get_db)):
     """
     Get details about a specific room.
 
-    Returns room information including current code, language, and active users.
+    Returns room information including language, active users, and the
+    file tree. File contents are fetched separately per file.
     """
     room = RoomService.get_room(db, room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
 
+    files = RoomService.list_files(db, room)
     return RoomDetail(
         id=room.id,
-        code=room.code,
         language=room.language,
         created_at=room.created_at,
-        active_users=room.active_users
+        active_users=room.active_users,
+        files=[RoomFileInfo.model_validate(f) for f in files]
     )
+
+
+@router.get("/{room_id}/files", response_model=List[RoomFileInfo])
+async def list_files(room_id: str, db: Session = Depends(get_db)):
+    """
+    List the files in a room.
+
+    Returns paths and languages only, without file contents.
+    """
+    room = RoomService.get_room(db, room_id)
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    return [RoomFileInfo.model_validate(f) for f in RoomService.list_files(db, room)]
+
+
+@router.post("/{room_id}/files", response_model=RoomFileInfo, status_code=201)
+async def create_file(room_id: str, file_data: RoomFileCreate, db: Session = Depends(get_db)):
+    """
+    Create an empty file in a room.
+
+    The language is inferred from the file extension unless given.
+    """
+    room = RoomService.get_room(db, room_id)
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    if not RoomService.normalize_file_path(file_data.path):
+        raise HTTPException(status_code=400, detail="Invalid file path")
+
+    room_file = RoomService.create_file(db, room, file_data)
+    if not room_file:
+        raise HTTPException(status_code=409, detail="A file with this path already exists")
+
+    file_info = RoomFileInfo.model_validate(room_file)
+    await manager.broadcast_to_room({"type": "file_created", "file": file_info.model_dump()}, room_id)
+    return file_info
+
+
+@router.get("/{room_id}/files/{file_id}", response_model=RoomFileDetail)
+async def get_file(room_id: str, file_id: str, db: Session = Depends(get_db)):
+    """
+    Get a single file in a room, including its content.
+    """
+    room_file = RoomService.get_file(db, room_id, file_id)
+    if not room_file:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    return RoomFileDetail(
+        id=room_file.id,
+        path=room_file.path,
+        language=room_file.language,
+        code=room_file.content
+    )
+
+
+@router.delete("/{room_id}/files/{file_id}", status_code=204)
+async def delete_file(room_id: str, file_id: str, db: Session = Depends(get_db)):
+    """
+    Delete a file from a room.
+
+    The last remaining file in a room can't be deleted.
+    """
+    if not RoomService.get_file(db, room_id, file_id):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    if not RoomService.delete_file(db, room_id, file_id):
+        raise HTTPException(status_code=409, detail="Can't delete the last file in a room")
+
+    manager.close_file(file_id)
+    await manager.broadcast_to_room({"type": "file_deleted", "file_id": file_id}, room_id)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.services.websocket_manager import manager
 from app.services.room_service import RoomService
+from app.schemas.room import RoomFileInfo
 import json
 import logging
 
@@ -18,29 +19,59 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
     WebSocket endpoint for real-time code collaboration.
 
     Clients connect to this endpoint with a room_id.
-    All code updates are broadcast to other users in the same room.
+    Each client has one file open at a time; code updates and cursor
+    positions are only broadcast to other users with the same file open.
     """
+    # Turn clients away while shutting down
+    if manager.draining:
+        await manager.reject(websocket, "server_draining", close_code=1012)
+        return
+
+    # Queue for a join slot so a reconnect storm doesn't overload the database
+    if not await manager.acquire_join_slot():
+        logger.warning(f"Shedding connection to room {room_id}: join queue full")
+        await manager.reject(websocket, "server_busy", close_code=1013)
+        return
+
+    # A drain may have started while this client was queued
+    if manager.draining:
+        manager.release_join_slot()
+        await manager.reject(websocket, "server_draining", close_code=1012)
+        return
+
     # Get database session
     db: Session = next(get_db())
 
     try:
-        # Verify room exists
-        room = RoomService.get_room(db, room_id)
-        if not room:
-            await websocket.close(code=4004, reason="Room not found")
-            return
-
-        # Accept the connection
-        await manager.connect(websocket, room_id)
-
-        # Send current room state to the newly connected client
-        initial_state = {
-            "type": "init",
-            "code": room.code,
-            "language": room.language,
-            "active_users": manager.get_room_connection_count(room_id)
-        }
-        await manager.send_personal_message(json.dumps(initial_state), websocket)
+        try:
+            # Verify room exists
+            room = RoomService.get_room(db, room_id)
+            if not room:
+                await websocket.close(code=4004, reason="Room not found")
+                return
+
+            # Load the file tree, then only the content of the file opened first
+            files = RoomService.list_files(db, room)
+            entry_file = RoomService.get_entry_file(room, files)
+            active_file = RoomService.get_file(db, room_id, entry_file.id)
+
+            # Accept the connection, unless a drain started while loading the room
+            if not await manager.connect(websocket, room_id):
+                return
+            manager.subscribe(websocket, active_file.id)
+
+            # Send current room state to the newly connected client
+            initial_state = {
+                "type": "init",
+                "language": room.language,
+                "files": [RoomFileInfo.model_validate(f).model_dump() for f in files],
+                "file_id": active_file.id,
+                "code": active_file.content,
+                "active_users": manager.get_room_connection_count(room_id)
+            }
+            await manager.send_personal_message(json.dumps(initial_state), websocket)
+        finally:
+            manager.release_join_slot()
 
         # Notify other users about new connection
         user_join_message = {
@@ -53,33 +84,63 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
         while True:
             # Receive message from client
             data = await websocket.receive_text()
+            manager.touch(websocket)
             message = json.loads(data)
 
             message_type = message.get("type")
 
-            if message_type == "code_update":
-                # Update code in database
+            if message_type == "open_file":
+                # Switch this client to another file and send its content
+                room_file = RoomService.get_file(db, room_id, message.get("file_id", ""))
+                if not room_file:
+                    error_message = {"type": "error", "detail": "File not found"}
+                    await manager.send_personal_message(json.dumps(error_message), websocket)
+                    continue
+
+                manager.subscribe(websocket, room_file.id)
+                file_message = {
+                    "type": "file_opened",
+                    "file_id": room_file.id,
+                    "path": room_file.path,
+                    "language": room_file.language,
+                    "code": room_file.content
+                }
+                await manager.send_personal_message(json.dumps(file_message), websocket)
+
+            elif message_type == "code_update":
+                file_id = message.get("file_id") or manager.get_open_file(websocket)
+                if not file_id:
+                    continue
+
+                # Update file content in database
                 code = message.get("code", "")
-                RoomService.update_room_code(db, room_id, code)
+                if not RoomService.update_file_content(db, room_id, file_id, code):
+                    continue
 
-                # Broadcast to other users in the room (excluding sender)
+                # Broadcast to other users with this file open (excluding sender)
                 broadcast_message = {
                     "type": "code_update",
+                    "file_id": file_id,
                     "code": code,
                     "user_id": message.get("user_id")
                 }
-                await manager.broadcast_to_room(broadcast_message, room_id, exclude_websocket=websocket)
+                await manager.broadcast_to_file(broadcast_message, room_id, file_id, exclude_websocket=websocket)
 
             elif message_type == "cursor_position":
-                # Broadcast cursor position to other users
+                file_id = manager.get_open_file(websocket)
+                if not file_id:
+                    continue
+
+                # Broadcast cursor position to other users with this file open
                 cursor_message = {
                     "type": "cursor_position",
+                    "file_id": file_id,
                     "user_id": message.get("user_id"),
                     "position": message.get("position"),
                     "line": message.get("line"),
                     "column": message.get("column")
                 }
-                await manager.broadcast_to_room(cursor_message, room_id, exclude_websocket=websocket)
+                await manager.broadcast_to_file(cursor_message, room_id, file_id, exclude_websocket=websocket)
 
             elif message_type == "ping":
                 # Respond to ping with pong
@@ -92,14 +153,16 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
         logger.error(f"Error in WebSocket connection: {e}")
     finally:
         # Clean up connection
-        manager.disconnect(websocket, room_id)
-
-        # Notify other users about disconnection
-        user_left_message = {
-            "type": "user_left",
-            "active_users": manager.get_room_connection_count(room_id)
-        }
-        await manager.broadcast_to_room(user_left_message, room_id)
+        removed = manager.disconnect(websocket, room_id)
+
+        # Notify other users about disconnection. Skipped during a drain, when
+        # everyone is leaving, and when the reaper already announced it.
+        if removed and not manager.draining:
+            user_left_message = {
+                "type": "user_left",
+                "active_users": manager.get_room_connection_count(room_id)
+            }
+            await manager.broadcast_to_room(user_left_message, room_id)
 
         # Close database session
         db.close()
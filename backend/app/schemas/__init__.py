@@ -3,16 +3,24 @@ from app.schemas.room import (
     RoomCreate,
     RoomResponse,
     RoomDetail,
+    RoomFileCreate,
+    RoomFileInfo,
+    RoomFileDetail,
     CodeUpdate,
     AutocompleteRequest,
     AutocompleteResponse,
+    AutocompleteChunk,
 )
 
 __all__ = [
     "RoomCreate",
     "RoomResponse",
     "RoomDetail",
+    "RoomFileCreate",
+    "RoomFileInfo",
+    "RoomFileDetail",
     "CodeUpdate",
     "AutocompleteRequest",
     "AutocompleteResponse",
+    "AutocompleteChunk",
 ]
@@ -1,6 +1,6 @@
 """Pydantic schemas for room-related requests and responses."""
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -17,13 +17,34 @@ class RoomResponse(BaseModel):
         from_attributes = True
 
 
+class RoomFileCreate(BaseModel):
+    """Schema for creating a file in a room."""
+    path: str
+    language: Optional[str] = None
+
+
+class RoomFileInfo(BaseModel):
+    """Schema for a file tree entry (no content)."""
+    id: str
+    path: str
+    language: str
+
+    class Config:
+        from_attributes = True
+
+
+class RoomFileDetail(RoomFileInfo):
+    """Schema for a file including its content."""
+    code: str
+
+
 class RoomDetail(BaseModel):
     """Schema for detailed room information."""
     id: str
-    code: str
     language: str
     created_at: datetime
     active_users: int
+    files: List[RoomFileInfo]
 
     class Config:
         from_attributes = True
@@ -32,6 +53,7 @@ class RoomDetail(BaseModel):
 class CodeUpdate(BaseModel):
     """Schema for code update messages."""
     room_id: str
+    file_id: str
     code: str
     user_id: Optional[str] = None
 
@@ -48,3 +70,11 @@ class AutocompleteResponse(BaseModel):
     suggestion: str
     start_position: int
     end_position: int
+
+
+class AutocompleteChunk(BaseModel):
+    """Schema for a single frame of a streamed autocomplete suggestion."""
+    delta: str
+    start_position: int
+    end_position: int
+    done: bool = False
@@ -1,5 +1,7 @@
 """Service for mocked AI autocomplete suggestions."""
-from app.schemas.room import AutocompleteRequest, AutocompleteResponse
+from app.schemas.room import AutocompleteRequest, AutocompleteResponse, AutocompleteChunk
+from typing import AsyncIterator
+import asyncio
 import re
 
 
@@ -12,6 +14,50 @@ class AutocompleteService:
         Generate a mocked autocomplete suggestion based on the code and cursor position.
         This is a simple rule-based system for demonstration purposes.
         """
+        suggestion = AutocompleteService._match_suggestion(request)
+        cursor_pos = request.cursor_position
+
+        return AutocompleteResponse(
+            suggestion=suggestion,
+            start_position=cursor_pos,
+            end_position=cursor_pos + len(suggestion)
+        )
+
+    @staticmethod
+    async def stream_suggestion(request: AutocompleteRequest) -> AsyncIterator[AutocompleteChunk]:
+        """
+        Stream an autocomplete suggestion one line at a time.
+
+        Every chunk carries the same start_position so the client can append
+        each delta to the text it has already inserted. The final chunk has
+        done=True and an empty delta. Closing the generator (e.g. when the
+        client disconnects) stops any further work immediately.
+        """
+        suggestion = AutocompleteService._match_suggestion(request)
+        cursor_pos = request.cursor_position
+        end_pos = cursor_pos
+
+        for delta in suggestion.splitlines(keepends=True):
+            end_pos += len(delta)
+            yield AutocompleteChunk(
+                delta=delta,
+                start_position=cursor_pos,
+                end_position=end_pos,
+                done=False
+            )
+            # Yield control between chunks so cancellation is honoured promptly
+            await asyncio.sleep(0)
+
+        yield AutocompleteChunk(
+            delta="",
+            start_position=cursor_pos,
+            end_position=end_pos,
+            done=True
+        )
+
+    @staticmethod
+    def _match_suggestion(request: AutocompleteRequest) -> str:
+        """Return the suggestion text for the line under the cursor."""
         code = request.code
         cursor_pos = request.cursor_position
         language = request.language
@@ -156,8 +202,4 @@ class AutocompleteService:
         else:
             suggestion = "  // Continue coding..."
 
-        return AutocompleteResponse(
-            suggestion=suggestion,
-            start_position=cursor_pos,
-            end_position=cursor_pos + len(suggestion)
-        )
+        return suggestion
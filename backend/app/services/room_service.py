@@ -1,10 +1,36 @@
 """Service layer for room management."""
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer
 from app.models.room import Room
-from app.schemas.room import RoomCreate
-from typing import Optional
+from app.models.room_file import RoomFile
+from app.schemas.room import RoomCreate, RoomFileCreate
+from typing import List, Optional
+import os
 import uuid
 
+# Default entry-point file name for each supported language
+DEFAULT_FILE_NAMES = {
+    "python": "main.py",
+    "javascript": "main.js",
+    "typescript": "main.ts",
+    "java": "Main.java",
+    "cpp": "main.cpp",
+    "go": "main.go",
+}
+
+# Language inferred from a file's extension
+EXTENSION_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".h": "cpp",
+    ".hpp": "cpp",
+    ".go": "go",
+}
+
 
 class RoomService:
     """Service for managing coding rooms."""
@@ -12,30 +38,166 @@ class RoomService:
     @staticmethod
     def create_room(db: Session, room_data: RoomCreate) -> Room:
         """Create a new coding room."""
+        starter_code = f"# Start coding in {room_data.language}...\n"
         room = Room(
             id=str(uuid.uuid4()),
             language=room_data.language,
-            code=f"# Start coding in {room_data.language}...\n"
+            code=starter_code
         )
         db.add(room)
+        db.flush()
+        db.add(RoomService._default_file(room, starter_code))
         db.commit()
         db.refresh(room)
         return room
 
     @staticmethod
     def get_room(db: Session, room_id: str) -> Optional[Room]:
-        """Get a room by ID."""
-        return db.query(Room).filter(Room.id == room_id).first()
+        """
+        Get a room by ID.
+
+        The legacy code column is deferred; it's only read when seeding the
+        first file of a room created before multi-file workspaces.
+        """
+        return db.query(Room).options(defer(Room.code)).filter(Room.id == room_id).first()
 
     @staticmethod
-    def update_room_code(db: Session, room_id: str, code: str) -> Optional[Room]:
-        """Update the code in a room."""
-        room = db.query(Room).filter(Room.id == room_id).first()
-        if room:
-            room.code = code
+    def list_files(db: Session, room: Room) -> List[RoomFile]:
+        """
+        Get a room's file tree without loading file contents.
+
+        Rooms created before multi-file workspaces get a single file seeded
+        from their legacy code column on first access. If a concurrent
+        request seeds it first, the unique path constraint rejects this
+        insert and the other request's file is returned instead.
+        """
+        files = RoomService._query_files(db, room.id)
+        if files:
+            return files
+
+        db.add(RoomService._default_file(room, room.code or ""))
+        try:
             db.commit()
-            db.refresh(room)
-        return room
+        except IntegrityError:
+            db.rollback()
+
+        return RoomService._query_files(db, room.id)
+
+    @staticmethod
+    def _query_files(db: Session, room_id: str) -> List[RoomFile]:
+        """Query a room's files ordered by path, with contents deferred."""
+        return (
+            db.query(RoomFile)
+            .options(defer(RoomFile.content))
+            .filter(RoomFile.room_id == room_id)
+            .order_by(RoomFile.path)
+            .all()
+        )
+
+    @staticmethod
+    def get_entry_file(room: Room, files: List[RoomFile]) -> RoomFile:
+        """Pick the file new participants open first: the room's default entry file if it exists."""
+        entry_path = DEFAULT_FILE_NAMES.get(room.language, "main.txt")
+        for room_file in files:
+            if room_file.path == entry_path:
+                return room_file
+        return files[0]
+
+    @staticmethod
+    def get_file(db: Session, room_id: str, file_id: str) -> Optional[RoomFile]:
+        """
+        Get a single file, including its content.
+
+        WebSocket handlers keep one session for the whole connection, so the
+        row is always re-read rather than served from the identity map.
+        """
+        return (
+            db.query(RoomFile)
+            .populate_existing()
+            .filter(RoomFile.room_id == room_id, RoomFile.id == file_id)
+            .first()
+        )
+
+    @staticmethod
+    def normalize_file_path(path: str) -> Optional[str]:
+        """Strip whitespace and leading slashes from a file path. Returns None if nothing is left."""
+        path = path.strip().lstrip("/").strip()
+        return path or None
+
+    @staticmethod
+    def create_file(db: Session, room: Room, file_data: RoomFileCreate) -> Optional[RoomFile]:
+        """
+        Create an empty file in a room.
+
+        Returns None if the path is already taken. Callers validate the path
+        with normalize_file_path first.
+        """
+        path = RoomService.normalize_file_path(file_data.path)
+        if not path:
+            return None
+
+        exists = (
+            db.query(RoomFile.id)
+            .filter(RoomFile.room_id == room.id, RoomFile.path == path)
+            .first()
+        )
+        if exists:
+            return None
+
+        room_file = RoomFile(
+            id=str(uuid.uuid4()),
+            room_id=room.id,
+            path=path,
+            language=file_data.language or RoomService._language_for_path(path, room.language),
+            content=""
+        )
+        db.add(room_file)
+        db.commit()
+        db.refresh(room_file)
+        return room_file
+
+    @staticmethod
+    def update_file_content(db: Session, room_id: str, file_id: str, code: str) -> bool:
+        """Update the content of a file in a room without loading the old content."""
+        updated = (
+            db.query(RoomFile)
+            .filter(RoomFile.room_id == room_id, RoomFile.id == file_id)
+            .update({RoomFile.content: code}, synchronize_session=False)
+        )
+        db.commit()
+        return updated > 0
+
+    @staticmethod
+    def delete_file(db: Session, room_id: str, file_id: str) -> bool:
+        """Delete a file from a room. The last remaining file can't be deleted."""
+        file_count = db.query(RoomFile).filter(RoomFile.room_id == room_id).count()
+        if file_count <= 1:
+            return False
+
+        deleted = (
+            db.query(RoomFile)
+            .filter(RoomFile.room_id == room_id, RoomFile.id == file_id)
+            .delete()
+        )
+        db.commit()
+        return deleted > 0
+
+    @staticmethod
+    def _default_file(room: Room, content: str) -> RoomFile:
+        """Build the entry-point file for a room."""
+        return RoomFile(
+            id=str(uuid.uuid4()),
+            room_id=room.id,
+            path=DEFAULT_FILE_NAMES.get(room.language, "main.txt"),
+            language=room.language,
+            content=content
+        )
+
+    @staticmethod
+    def _language_for_path(path: str, fallback: str) -> str:
+        """Infer a file's language from its extension."""
+        _, extension = os.path.splitext(path)
+        return EXTENSION_LANGUAGES.get(extension.lower(), fallback)
 
     @staticmethod
     def increment_active_users(db: Session, room_id: str) -> Optional[Room]:
@@ -1,8 +1,12 @@
 """WebSocket connection manager for real-time collaboration."""
-from typing import Dict, List
+from typing import Dict, List, Optional
 from fastapi import WebSocket
+from app.config import settings
+import asyncio
 import json
 import logging
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -13,22 +17,56 @@ class ConnectionManager:
     def __init__(self):
         # Dictionary mapping room_id to list of active WebSocket connections
         self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Connections subscribed to each file, and the file each connection has open
+        self.file_subscribers: Dict[str, List[WebSocket]] = {}
+        self.open_files: Dict[WebSocket, str] = {}
+        # Monotonic time of the last message received from each connection
+        self.last_seen: Dict[WebSocket, float] = {}
+        # Background task that pings clients and reaps dead connections
+        self._reaper_task: Optional[asyncio.Task] = None
+        # Limits how many clients may load room state at the same time
+        self._join_slots: Optional[asyncio.Semaphore] = None
+        # Set once shutdown has started; new connections are turned away
+        self.draining = False
 
-    async def connect(self, websocket: WebSocket, room_id: str):
-        """Accept a new WebSocket connection and add it to a room."""
+    async def connect(self, websocket: WebSocket, room_id: str) -> bool:
+        """
+        Accept a new WebSocket connection and add it to a room.
+
+        Returns False if a drain started while the client was joining; the
+        client is then sent server_draining and closed instead of being added.
+        """
         await websocket.accept()
 
+        # No await between this check and registering the connection, so a
+        # drain either sees this socket or this socket sees the drain
+        if self.draining:
+            await self._send_reconnect_hint(websocket, "server_draining", close_code=1012)
+            return False
+
         if room_id not in self.active_connections:
             self.active_connections[room_id] = []
 
         self.active_connections[room_id].append(websocket)
+        self.last_seen[websocket] = time.monotonic()
         logger.info(f"Client connected to room {room_id}. Total connections: {len(self.active_connections[room_id])}")
+        return True
+
+    def disconnect(self, websocket: WebSocket, room_id: str) -> bool:
+        """
+        Remove a WebSocket connection from a room.
+
+        Returns True if the connection was still registered, so callers can
+        skip notifications when the reaper has already removed it.
+        """
+        removed = False
+        self.last_seen.pop(websocket, None)
+        self.unsubscribe(websocket)
 
-    def disconnect(self, websocket: WebSocket, room_id: str):
-        """Remove a WebSocket connection from a room."""
         if room_id in self.active_connections:
             if websocket in self.active_connections[room_id]:
                 self.active_connections[room_id].remove(websocket)
+                removed = True
                 logger.info(f"Client disconnected from room {room_id}. Remaining connections: {len(self.active_connections[room_id])}")
 
             # Clean up empty rooms
@@ -36,6 +74,41 @@ class ConnectionManager:
                 del self.active_connections[room_id]
                 logger.info(f"Room {room_id} removed (no active connections)")
 
+        return removed
+
+    def subscribe(self, websocket: WebSocket, file_id: str):
+        """Make file_id the one file a connection receives edits and cursors for."""
+        self.unsubscribe(websocket)
+        self.open_files[websocket] = file_id
+        self.file_subscribers.setdefault(file_id, []).append(websocket)
+
+    def unsubscribe(self, websocket: WebSocket):
+        """Stop sending file-scoped messages to a connection."""
+        file_id = self.open_files.pop(websocket, None)
+        if file_id is None:
+            return
+
+        subscribers = self.file_subscribers.get(file_id, [])
+        if websocket in subscribers:
+            subscribers.remove(websocket)
+        if not subscribers:
+            self.file_subscribers.pop(file_id, None)
+
+    def get_open_file(self, websocket: WebSocket) -> Optional[str]:
+        """Get the ID of the file a connection has open."""
+        return self.open_files.get(websocket)
+
+    def close_file(self, file_id: str) -> List[WebSocket]:
+        """Unsubscribe everyone from a file (e.g. when it's deleted) and return who had it open."""
+        subscribers = list(self.file_subscribers.get(file_id, []))
+        for websocket in subscribers:
+            self.unsubscribe(websocket)
+        return subscribers
+
+    def touch(self, websocket: WebSocket):
+        """Record that a message was just received from a connection."""
+        self.last_seen[websocket] = time.monotonic()
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
         await websocket.send_text(message)
@@ -52,13 +125,38 @@ class ConnectionManager:
         if room_id not in self.active_connections:
             return
 
+        await self._send_to_connections(message, room_id, self.active_connections[room_id], exclude_websocket)
+
+    async def broadcast_to_file(self, message: dict, room_id: str, file_id: str, exclude_websocket: WebSocket = None):
+        """
+        Broadcast a message only to connections that have a file open.
+
+        Args:
+            message: Dictionary to be sent as JSON
+            room_id: ID of the room the file belongs to
+            file_id: ID of the file whose subscribers should receive the message
+            exclude_websocket: Optional WebSocket to exclude from broadcast (e.g., the sender)
+        """
+        if file_id not in self.file_subscribers:
+            return
+
+        await self._send_to_connections(message, room_id, self.file_subscribers[file_id], exclude_websocket)
+
+    async def _send_to_connections(
+        self,
+        message: dict,
+        room_id: str,
+        connections: List[WebSocket],
+        exclude_websocket: WebSocket = None
+    ):
+        """Send a message to each connection, removing any that fail."""
         # Convert message to JSON string
         message_str = json.dumps(message)
 
         # List to track connections that need to be removed
         disconnected = []
 
-        for connection in self.active_connections[room_id]:
+        for connection in list(connections):
             # Skip the excluded websocket (typically the sender)
             if exclude_websocket and connection == exclude_websocket:
                 continue
@@ -69,9 +167,178 @@ class ConnectionManager:
                 logger.error(f"Error sending message to client: {e}")
                 disconnected.append(connection)
 
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection, room_id)
+        # Clean up disconnected clients and tell the rest of the room once
+        removed = [connection for connection in disconnected if self.disconnect(connection, room_id)]
+        if removed and message.get("type") != "user_left":
+            user_left_message = {
+                "type": "user_left",
+                "active_users": self.get_room_connection_count(room_id)
+            }
+            await self.broadcast_to_room(user_left_message, room_id)
+
+    async def acquire_join_slot(self) -> bool:
+        """
+        Wait for a free join slot so only a bounded number of clients hit the
+        database at once. Returns False if none frees up within the queue timeout.
+        """
+        if self._join_slots is None:
+            self._join_slots = asyncio.Semaphore(settings.max_concurrent_joins)
+
+        try:
+            await asyncio.wait_for(self._join_slots.acquire(), timeout=settings.join_queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def release_join_slot(self):
+        """Release a join slot acquired with acquire_join_slot."""
+        if self._join_slots is not None:
+            self._join_slots.release()
+
+    def get_reconnect_delay(self) -> int:
+        """Pick a randomized reconnect delay (ms) so clients don't return in lockstep."""
+        return random.randint(settings.reconnect_delay_min_ms, settings.reconnect_delay_max_ms)
+
+    async def reject(self, websocket: WebSocket, message_type: str, close_code: int):
+        """
+        Turn a client away with a reconnect hint instead of loading the room.
+
+        The socket is accepted first so the client can read the message;
+        browsers hide the reason of a connection refused during the handshake.
+        """
+        await websocket.accept()
+        await self._send_reconnect_hint(websocket, message_type, close_code)
+
+    async def _send_reconnect_hint(self, websocket: WebSocket, message_type: str, close_code: int):
+        """Send an accepted client a randomized reconnect delay, then close it."""
+        message = {"type": message_type, "reconnect_delay_ms": self.get_reconnect_delay()}
+        try:
+            await websocket.send_text(json.dumps(message))
+            await websocket.close(code=close_code)
+        except Exception as e:
+            logger.error(f"Error rejecting client: {e}")
+
+    async def reap_stale_connections(self):
+        """
+        Ping every client and remove dead connections from all rooms in one pass.
+
+        A connection is dead if nothing was received from it within the
+        heartbeat timeout or if the ping can't be sent. Each affected room
+        gets a single user_left message, however many sockets it lost.
+        """
+        now = time.monotonic()
+        stale: List[tuple] = []
+        live: List[tuple] = []
+
+        for room_id, connections in self.active_connections.items():
+            for connection in connections:
+                last_seen = self.last_seen.get(connection, now)
+                if now - last_seen > settings.heartbeat_timeout:
+                    stale.append((room_id, connection))
+                else:
+                    live.append((room_id, connection))
+
+        ping_str = json.dumps({"type": "ping"})
+        # A socket with a full write buffer must not hold up the whole pass;
+        # a send that times out marks the connection stale like any other failure
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_text(ping_str), timeout=settings.heartbeat_send_timeout)
+                for _, connection in live
+            ),
+            return_exceptions=True
+        )
+        stale.extend(entry for entry, result in zip(live, results) if isinstance(result, Exception))
+
+        if not stale:
+            return
+
+        affected_rooms = set()
+        for room_id, connection in stale:
+            if self.disconnect(connection, room_id):
+                affected_rooms.add(room_id)
+
+        await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.close(code=1001), timeout=settings.heartbeat_send_timeout)
+                for _, connection in stale
+            ),
+            return_exceptions=True
+        )
+        logger.info(f"Reaped {len(stale)} stale connections across {len(affected_rooms)} rooms")
+
+        for room_id in affected_rooms:
+            user_left_message = {
+                "type": "user_left",
+                "active_users": self.get_room_connection_count(room_id)
+            }
+            await self.broadcast_to_room(user_left_message, room_id)
+
+    async def _run_reaper(self):
+        """Run reap_stale_connections on the heartbeat interval until cancelled."""
+        while True:
+            await asyncio.sleep(settings.heartbeat_interval)
+            try:
+                await self.reap_stale_connections()
+            except Exception as e:
+                logger.error(f"Error reaping stale connections: {e}")
+
+    def start_reaper(self):
+        """Start the background heartbeat/reaper task."""
+        if self._reaper_task is None:
+            self._reaper_task = asyncio.create_task(self._run_reaper())
+
+    async def stop_reaper(self):
+        """Stop the background heartbeat/reaper task."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+    async def drain(self):
+        """
+        Gracefully shut down all rooms.
+
+        Every client receives a server_draining message with its own randomized
+        reconnect delay. After a short grace period, which lets handlers finish
+        persisting any code updates already in flight, all sockets are closed
+        with 1012 (service restart).
+        """
+        if self.draining:
+            return
+        self.draining = True
+        await self.stop_reaper()
+
+        connections = [
+            connection
+            for room_connections in self.active_connections.values()
+            for connection in room_connections
+        ]
+        logger.info(f"Draining {len(connections)} connections across {len(self.active_connections)} rooms")
+
+        async def notify(connection: WebSocket):
+            message = {"type": "server_draining", "reconnect_delay_ms": self.get_reconnect_delay()}
+            await connection.send_text(json.dumps(message))
+
+        timeout = settings.heartbeat_send_timeout
+        await asyncio.gather(
+            *(asyncio.wait_for(notify(c), timeout=timeout) for c in connections),
+            return_exceptions=True
+        )
+        await asyncio.sleep(settings.drain_grace_period)
+        await asyncio.gather(
+            *(asyncio.wait_for(c.close(code=1012), timeout=timeout) for c in connections),
+            return_exceptions=True
+        )
+
+        self.active_connections.clear()
+        self.file_subscribers.clear()
+        self.open_files.clear()
+        self.last_seen.clear()
+        logger.info("Drain complete")
 
     def get_room_connection_count(self, room_id: str) -> int:
         """Get the number of active connections in a room."""
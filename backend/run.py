@@ -1,12 +1,33 @@
 """Run script for the FastAPI application."""
 import uvicorn
+from uvicorn.supervisors import ChangeReload
 from app.config import settings
+from app.services.websocket_manager import manager
+
+
+class DrainingServer(uvicorn.Server):
+    """Uvicorn server that drains WebSocket rooms before it drops open sockets."""
+
+    async def shutdown(self, sockets=None):
+        await manager.drain()
+        await super().shutdown(sockets=sockets)
+
 
 if __name__ == "__main__":
-    uvicorn.run(
+    config = uvicorn.Config(
         "app.main:app",
         host=settings.app_host,
         port=settings.app_port,
         reload=settings.debug,
-        log_level="info"
+        log_level="info",
+        # Protocol-level pings; uvicorn closes the socket if no pong arrives in time
+        ws_ping_interval=settings.heartbeat_interval,
+        ws_ping_timeout=settings.heartbeat_timeout
     )
+    server = DrainingServer(config)
+
+    if config.should_reload:
+        sock = config.bind_socket()
+        ChangeReload(config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
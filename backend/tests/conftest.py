@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before it is imported
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["DEBUG"] = "False"
+
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+from app.routers import rooms, websocket
+from app.services import websocket_manager
+from app.services.websocket_manager import ConnectionManager
+import app.main as main
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A fresh ConnectionManager wired into every module that uses the global one."""
+    fresh_manager = ConnectionManager()
+    for module in (websocket_manager, main, rooms, websocket):
+        monkeypatch.setattr(module, "manager", fresh_manager)
+    return fresh_manager
+
+
+@pytest.fixture
+def client(manager, monkeypatch):
+    """Test client with the application's startup and shutdown events run."""
+    # Shutdown drains the manager; don't wait out the grace period in tests
+    monkeypatch.setattr(settings, "drain_grace_period", 0)
+    with TestClient(app) as test_client:
+        yield test_client
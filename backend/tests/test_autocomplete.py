@@ -0,0 +1,45 @@
+"""Tests for the autocomplete endpoints."""
+import json
+
+REQUEST = {"code": "class Greeter", "cursor_position": 13, "language": "python"}
+SUGGESTION = ":\n    def __init__(self):\n        pass"
+
+
+def test_autocomplete_returns_full_suggestion(client):
+    response = client.post("/autocomplete", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "suggestion": SUGGESTION,
+        "start_position": 13,
+        "end_position": 13 + len(SUGGESTION),
+    }
+
+
+def test_autocomplete_stream_emits_sse_frames(client):
+    response = client.post("/autocomplete/stream", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.endswith("\n\n")
+
+    events = response.text.split("\n\n")[:-1]
+    assert all(event.startswith("data: ") for event in events)
+    chunks = [json.loads(event[len("data: "):]) for event in events]
+
+    *partial, final = chunks
+    assert len(partial) == 3
+    assert all(chunk["start_position"] == 13 for chunk in chunks)
+    assert all(not chunk["done"] for chunk in partial)
+
+    end_positions = [chunk["end_position"] for chunk in partial]
+    assert end_positions == sorted(set(end_positions))
+    assert "".join(chunk["delta"] for chunk in partial) == SUGGESTION
+    assert end_positions[-1] == 13 + len(SUGGESTION)
+
+    assert final == {
+        "delta": "",
+        "start_position": 13,
+        "end_position": 13 + len(SUGGESTION),
+        "done": True,
+    }
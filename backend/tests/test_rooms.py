@@ -0,0 +1,57 @@
+"""Tests for the room REST endpoints."""
+
+
+def test_create_file_rejects_blank_and_duplicate_paths(client):
+    room_id = client.post("/rooms", json={"language": "python"}).json()["room_id"]
+
+    response = client.post(f"/rooms/{room_id}/files", json={"path": "utils.py"})
+    assert response.status_code == 201
+    assert response.json()["language"] == "python"
+
+    assert client.post(f"/rooms/{room_id}/files", json={"path": "  / "}).status_code == 400
+    assert client.post(f"/rooms/{room_id}/files", json={"path": "/utils.py"}).status_code == 409
+
+
+def test_legacy_room_is_seeded_once_when_requests_race(client, monkeypatch):
+    from app.database.connection import SessionLocal
+    from app.models import Room, RoomFile
+    from app.services.room_service import RoomService
+
+    db = SessionLocal()
+    db.add(Room(id="legacy-room", language="python", code="print('old')\n"))
+    db.commit()
+    db.close()
+
+    build_default_file = RoomService._default_file
+
+    def seed_concurrently(room, content):
+        # Another request seeds the same room between our query and insert
+        other_db = SessionLocal()
+        other_db.add(build_default_file(room, content))
+        other_db.commit()
+        other_db.close()
+        return build_default_file(room, content)
+
+    monkeypatch.setattr(RoomService, "_default_file", staticmethod(seed_concurrently))
+
+    response = client.get("/rooms/legacy-room")
+    assert response.status_code == 200
+    assert [f["path"] for f in response.json()["files"]] == ["main.py"]
+
+    db = SessionLocal()
+    room_file = db.query(RoomFile).filter(RoomFile.room_id == "legacy-room").one()
+    assert room_file.content == "print('old')\n"
+    db.close()
+
+
+def test_get_room_does_not_load_legacy_code(client):
+    from sqlalchemy import inspect
+    from app.database.connection import SessionLocal
+    from app.services.room_service import RoomService
+
+    room_id = client.post("/rooms", json={"language": "python"}).json()["room_id"]
+
+    db = SessionLocal()
+    room = RoomService.get_room(db, room_id)
+    assert "code" in inspect(room).unloaded
+    db.close()
@@ -0,0 +1,46 @@
+"""Tests for the WebSocket collaboration endpoint."""
+
+
+def create_room(client, language="python"):
+    return client.post("/rooms", json={"language": language}).json()["room_id"]
+
+
+def test_reopening_file_returns_latest_content(client):
+    room_id = create_room(client)
+    main_file = client.get(f"/rooms/{room_id}/files").json()[0]
+    other_file = client.post(f"/rooms/{room_id}/files", json={"path": "a.py"}).json()
+
+    with client.websocket_connect(f"/ws/{room_id}") as w1, client.websocket_connect(f"/ws/{room_id}") as w2:
+        assert w1.receive_json()["type"] == "init"
+        assert w2.receive_json()["type"] == "init"
+        assert w1.receive_json()["type"] == "user_joined"
+
+        for ws in (w1, w2):
+            ws.send_json({"type": "open_file", "file_id": main_file["id"]})
+            assert ws.receive_json()["type"] == "file_opened"
+
+        w1.send_json({"type": "code_update", "file_id": main_file["id"], "code": "x=1"})
+        assert w2.receive_json()["code"] == "x=1"
+
+        w2.send_json({"type": "open_file", "file_id": other_file["id"]})
+        assert w2.receive_json()["file_id"] == other_file["id"]
+
+        w1.send_json({"type": "code_update", "file_id": main_file["id"], "code": "x=2"})
+        # The pong is only sent once the update above has been saved
+        w1.send_json({"type": "ping"})
+        assert w1.receive_json()["type"] == "pong"
+
+        w2.send_json({"type": "open_file", "file_id": main_file["id"]})
+        reopened = w2.receive_json()
+        assert reopened["type"] == "file_opened"
+        assert reopened["code"] == "x=2"
+
+
+def test_init_opens_entry_file(client):
+    room_id = create_room(client)
+    client.post(f"/rooms/{room_id}/files", json={"path": "a.py"})
+
+    with client.websocket_connect(f"/ws/{room_id}") as ws:
+        init = ws.receive_json()
+        paths = {f["id"]: f["path"] for f in init["files"]}
+        assert paths[init["file_id"]] == "main.py"
@@ -0,0 +1,88 @@
+"""Tests for the WebSocket connection manager."""
+import asyncio
+import json
+from app.config import settings
+from app.services.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records sent messages."""
+
+    def __init__(self, send_delay: float = 0):
+        self.send_delay = send_delay
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(json.loads(message))
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+def test_reaper_drops_blocked_socket_without_stalling(monkeypatch):
+    monkeypatch.setattr(settings, "heartbeat_send_timeout", 0.05)
+
+    async def scenario():
+        manager = ConnectionManager()
+        healthy = FakeWebSocket()
+        blocked = FakeWebSocket(send_delay=10)
+        await manager.connect(healthy, "room")
+        await manager.connect(blocked, "room")
+
+        await asyncio.wait_for(manager.reap_stale_connections(), timeout=1)
+        return manager, healthy, blocked
+
+    manager, healthy, blocked = asyncio.run(scenario())
+
+    assert manager.active_connections["room"] == [healthy]
+    assert blocked.closed_with == 1001
+    assert [m["type"] for m in healthy.sent] == ["ping", "user_left"]
+    assert healthy.sent[-1]["active_users"] == 1
+
+
+def test_join_slot_times_out_when_pool_is_full(monkeypatch):
+    monkeypatch.setattr(settings, "max_concurrent_joins", 1)
+    monkeypatch.setattr(settings, "join_queue_timeout", 0.05)
+
+    async def scenario():
+        manager = ConnectionManager()
+        first = await manager.acquire_join_slot()
+        second = await manager.acquire_join_slot()
+        manager.release_join_slot()
+        third = await manager.acquire_join_slot()
+        return first, second, third
+
+    assert asyncio.run(scenario()) == (True, False, True)
+
+
+def test_drain_notifies_closes_and_refuses_later_joins(monkeypatch):
+    monkeypatch.setattr(settings, "drain_grace_period", 0)
+
+    async def scenario():
+        manager = ConnectionManager()
+        clients = [FakeWebSocket(), FakeWebSocket()]
+        await manager.connect(clients[0], "room-a")
+        await manager.connect(clients[1], "room-b")
+
+        await manager.drain()
+
+        late = FakeWebSocket()
+        joined = await manager.connect(late, "room-a")
+        return manager, clients, late, joined
+
+    manager, clients, late, joined = asyncio.run(scenario())
+
+    for client in clients + [late]:
+        assert [m["type"] for m in client.sent] == ["server_draining"]
+        delay = client.sent[0]["reconnect_delay_ms"]
+        assert settings.reconnect_delay_min_ms <= delay <= settings.reconnect_delay_max_ms
+        assert client.closed_with == 1012
+
+    assert joined is False
+    assert manager.draining
+    assert manager.active_connections == {}
@@ -14,17 +14,22 @@ interface CodeEditorProps {
 
 export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange }) => {
   const dispatch = useAppDispatch();
-  const { code, language, isConnected, activeUsers } = useAppSelector((state) => state.editor);
+  const { code, language, activeFileId, isConnected, activeUsers } = useAppSelector((state) => state.editor);
   const editorRef = useRef<any>(null);
+  const monacoRef = useRef<any>(null);
   const isRemoteUpdateRef = useRef(false);
   const providerRef = useRef<any>(null);
+  // In-flight streamed suggestion; aborted when the cursor moves or on unmount
+  const suggestionAbortRef = useRef<AbortController | null>(null);
 
   // Handle editor mount
   const handleEditorDidMount = (editor: any, monaco: any) => {
     editorRef.current = editor;
+    monacoRef.current = monaco;
 
     // Listen to cursor position changes
     editor.onDidChangeCursorPosition((e: any) => {
+      suggestionAbortRef.current?.abort();
       const position = editor.getModel()?.getOffsetAt(e.position) || 0;
       dispatch(setCursorPosition(position));
     });
@@ -36,7 +41,7 @@ export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange })
 
     // Register custom autocomplete provider
     providerRef.current = monaco.languages.registerCompletionItemProvider(language, {
-      provideCompletionItems: async (model: any, position: any) => {
+      provideCompletionItems: async (model: any, position: any, _context: any, token: any) => {
         const textUntilPosition = model.getValueInRange({
           startLineNumber: 1,
           startColumn: 1,
@@ -44,20 +49,33 @@ export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange })
           endColumn: position.column,
         });
 
-        try {
-          const response = await autocompleteApi.getSuggestion({
-            code: textUntilPosition,
-            cursor_position: textUntilPosition.length,
-            language,
-          });
+        // Cancel any earlier request still streaming, and this one if Monaco drops it
+        suggestionAbortRef.current?.abort();
+        const controller = new AbortController();
+        suggestionAbortRef.current = controller;
+        token.onCancellationRequested(() => controller.abort());
 
-          if (response.suggestion && response.suggestion.trim()) {
+        try {
+          let suggestion = '';
+          await autocompleteApi.streamSuggestion(
+            {
+              code: textUntilPosition,
+              cursor_position: textUntilPosition.length,
+              language,
+            },
+            (chunk) => {
+              suggestion += chunk.delta;
+            },
+            controller.signal,
+          );
+
+          if (suggestion.trim()) {
             return {
               suggestions: [
                 {
-                  label: response.suggestion.split('\n')[0].trim(),
+                  label: suggestion.split('\n')[0].trim(),
                   kind: monaco.languages.CompletionItemKind.Snippet,
-                  insertText: response.suggestion,
+                  insertText: suggestion,
                   insertTextRules: monaco.languages.CompletionItemInsertTextRule.InsertAsSnippet,
                   documentation: 'AI-powered suggestion',
                   detail: '✨ Smart completion',
@@ -66,8 +84,14 @@ export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange })
               ],
             };
           }
-        } catch (error) {
-          console.error('Error getting autocomplete:', error);
+        } catch (error: any) {
+          if (error?.name !== 'AbortError') {
+            console.error('Error getting autocomplete:', error);
+          }
+        } finally {
+          if (suggestionAbortRef.current === controller) {
+            suggestionAbortRef.current = null;
+          }
         }
 
         return { suggestions: [] };
@@ -106,9 +130,26 @@ export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange })
     }
   }, [code]);
 
+  // Each file gets its own model (via the path prop), so switching files never
+  // lands on an undo stack. Models of files we switched away from are disposed:
+  // reopening a file then starts from the server's content with a clean history.
+  useEffect(() => {
+    const editor = editorRef.current;
+    const monaco = monacoRef.current;
+    if (!editor || !monaco) return;
+
+    const currentModel = editor.getModel();
+    monaco.editor.getModels().forEach((model: any) => {
+      if (model !== currentModel) {
+        model.dispose();
+      }
+    });
+  }, [activeFileId]);
+
   // Cleanup provider on unmount
   useEffect(() => {
     return () => {
+      suggestionAbortRef.current?.abort();
       if (providerRef.current) {
         providerRef.current.dispose();
       }
@@ -143,6 +184,7 @@ export const CodeEditor: React.FC<CodeEditorProps> = ({ roomId, onCodeChange })
       <div style={{ flex: 1 }}>
         <Editor
           height="100%"
+          path={activeFileId ?? undefined}
           language={language}
           value={code}
           theme="vs-dark"
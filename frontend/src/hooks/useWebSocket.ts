@@ -3,36 +3,98 @@
  */
 import { useEffect, useCallback, useRef } from 'react';
 import { wsService } from '../services/websocket';
-import { useAppDispatch } from './useRedux';
-import { setCode, setLanguage, setActiveUsers, setConnected } from '../store/editorSlice';
-import type { WebSocketMessage } from '../types';
+import { useAppDispatch, useAppSelector } from './useRedux';
+import {
+  setCode,
+  setLanguage,
+  setActiveUsers,
+  setConnected,
+  setFiles,
+  addFile,
+  removeFile,
+  setActiveFile,
+} from '../store/editorSlice';
+import type { RoomFile, WebSocketMessage } from '../types';
 
 export const useWebSocket = (roomId: string | undefined) => {
   const dispatch = useAppDispatch();
   const dispatchRef = useRef(dispatch);
+  const { files, activeFileId } = useAppSelector((state) => state.editor);
+  const filesRef = useRef<RoomFile[]>(files);
+  const activeFileIdRef = useRef<string | null>(activeFileId);
 
-  // Keep dispatch ref updated
+  // Keep refs updated
   useEffect(() => {
     dispatchRef.current = dispatch;
   }, [dispatch]);
 
+  useEffect(() => {
+    filesRef.current = files;
+    activeFileIdRef.current = activeFileId;
+  }, [files, activeFileId]);
+
   const handleMessage = useCallback((message: WebSocketMessage) => {
     switch (message.type) {
-      case 'init':
-        // Initial state from server
-        if (message.code) dispatchRef.current(setCode(message.code));
+      case 'init': {
+        // Initial state from server: the file tree plus the content of one file
         if (message.language) dispatchRef.current(setLanguage(message.language));
+        if (message.files) {
+          filesRef.current = message.files;
+          dispatchRef.current(setFiles(message.files));
+        }
+        if (message.file_id) {
+          // Update the ref now so messages handled before the next render see the new file
+          activeFileIdRef.current = message.file_id;
+          const file = message.files?.find(f => f.id === message.file_id);
+          dispatchRef.current(setActiveFile({
+            fileId: message.file_id,
+            code: message.code ?? '',
+            language: file?.language,
+          }));
+        }
         if (message.active_users !== undefined) dispatchRef.current(setActiveUsers(message.active_users));
         dispatchRef.current(setConnected(true));
         break;
+      }
+
+      case 'file_opened':
+        // Content of a file we asked to open
+        if (message.file_id) {
+          activeFileIdRef.current = message.file_id;
+          dispatchRef.current(setActiveFile({
+            fileId: message.file_id,
+            code: message.code ?? '',
+            language: message.language,
+          }));
+        }
+        break;
+
+      case 'file_created':
+        if (message.file) dispatchRef.current(addFile(message.file));
+        break;
+
+      case 'file_deleted':
+        if (message.file_id) {
+          dispatchRef.current(removeFile(message.file_id));
+          // Our open file is gone; switch to another one
+          if (message.file_id === activeFileIdRef.current) {
+            const next = filesRef.current.find(f => f.id !== message.file_id);
+            if (next) wsService.openFile(next.id);
+          }
+        }
+        break;
 
       case 'code_update':
-        // Code update from another user
-        if (message.code) {
+        // Code update from another user; only applies to the open file
+        if (message.code !== undefined && message.file_id === activeFileIdRef.current) {
           dispatchRef.current(setCode(message.code));
         }
         break;
 
+      case 'error':
+        console.error('Server error:', message.detail);
+        break;
+
       case 'user_joined':
       case 'user_left':
         // Update active users count
@@ -47,6 +109,18 @@ export const useWebSocket = (roomId: string | undefined) => {
         console.log('Cursor position update:', message);
         break;
 
+      case 'server_draining':
+      case 'server_busy':
+        // Server is restarting or overloaded; the service reconnects after the requested delay
+        console.log(`Server asked to reconnect in ${message.reconnect_delay_ms}ms`);
+        dispatchRef.current(setConnected(false));
+        break;
+
+      case 'ping':
+        // Server heartbeat; reply so the connection isn't reaped as idle
+        wsService.send({ type: 'pong' });
+        break;
+
       case 'pong':
         // Handle pong response
         break;
@@ -80,8 +154,13 @@ export const useWebSocket = (roomId: string | undefined) => {
     };
   }, [roomId, handleMessage]);
 
+  const sendCodeUpdate = useCallback((code: string, userId?: string) => {
+    wsService.sendCodeUpdate(code, activeFileIdRef.current, userId);
+  }, []);
+
   return {
-    sendCodeUpdate: wsService.sendCodeUpdate.bind(wsService),
+    sendCodeUpdate,
+    openFile: wsService.openFile.bind(wsService),
     sendCursorPosition: wsService.sendCursorPosition.bind(wsService),
     isConnected: wsService.isConnected.bind(wsService),
   };
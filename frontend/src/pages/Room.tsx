@@ -5,6 +5,7 @@ import { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { CodeEditor } from '../components/CodeEditor';
 import { useWebSocket } from '../hooks/useWebSocket';
+import { useAppSelector } from '../hooks/useRedux';
 import { roomsApi } from '../services/api';
 
 export const Room = () => {
@@ -13,7 +14,8 @@ export const Room = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
-  const { sendCodeUpdate } = useWebSocket(roomId);
+  const { sendCodeUpdate, openFile } = useWebSocket(roomId);
+  const { files, activeFileId } = useAppSelector((state) => state.editor);
 
   // Verify room exists on mount
   useEffect(() => {
@@ -42,6 +44,31 @@ export const Room = () => {
     sendCodeUpdate(code);
   };
 
+  const handleNewFile = async () => {
+    if (!roomId) return;
+    const path = window.prompt('File name');
+    if (!path) return;
+
+    try {
+      // The server announces the new file to everyone with file_created
+      const file = await roomsApi.createFile(roomId, path);
+      openFile(file.id);
+    } catch (err: any) {
+      console.error('Error creating file:', err);
+    }
+  };
+
+  const handleDeleteFile = async (fileId: string, path: string) => {
+    if (!roomId || !window.confirm(`Delete ${path}?`)) return;
+
+    try {
+      // The server announces the deletion to everyone with file_deleted
+      await roomsApi.deleteFile(roomId, fileId);
+    } catch (err: any) {
+      console.error('Error deleting file:', err);
+    }
+  };
+
   const handleLeaveRoom = () => {
     navigate('/');
   };
@@ -129,14 +156,82 @@ export const Room = () => {
         </button>
       </div>
 
-      {/* Editor */}
-      <div style={{ flex: 1 }}>
-        {roomId && (
-          <CodeEditor
-            roomId={roomId}
-            onCodeChange={handleCodeChange}
-          />
-        )}
+      <div style={{ flex: 1, display: 'flex', minHeight: 0 }}>
+        {/* File tree */}
+        <div style={{
+          width: '200px',
+          backgroundColor: '#252526',
+          color: '#cccccc',
+          display: 'flex',
+          flexDirection: 'column',
+          fontSize: '13px',
+        }}>
+          <div style={{
+            padding: '8px 12px',
+            display: 'flex',
+            justifyContent: 'space-between',
+            alignItems: 'center',
+          }}>
+            <span>FILES</span>
+            <button
+              onClick={handleNewFile}
+              style={{
+                padding: '2px 8px',
+                backgroundColor: 'transparent',
+                color: '#cccccc',
+                border: '1px solid #555',
+                borderRadius: '4px',
+                cursor: 'pointer',
+              }}
+            >
+              +
+            </button>
+          </div>
+          {files.map((file) => (
+            <div
+              key={file.id}
+              onClick={() => file.id !== activeFileId && openFile(file.id)}
+              style={{
+                padding: '4px 12px',
+                cursor: 'pointer',
+                backgroundColor: file.id === activeFileId ? '#37373d' : 'transparent',
+                display: 'flex',
+                justifyContent: 'space-between',
+                alignItems: 'center',
+              }}
+            >
+              <span>{file.path}</span>
+              {files.length > 1 && (
+                <button
+                  onClick={(e) => {
+                    e.stopPropagation();
+                    handleDeleteFile(file.id, file.path);
+                  }}
+                  title="Delete file"
+                  style={{
+                    padding: '0 4px',
+                    backgroundColor: 'transparent',
+                    color: '#cccccc',
+                    border: 'none',
+                    cursor: 'pointer',
+                  }}
+                >
+                  ×
+                </button>
+              )}
+            </div>
+          ))}
+        </div>
+
+        {/* Editor */}
+        <div style={{ flex: 1 }}>
+          {roomId && (
+            <CodeEditor
+              roomId={roomId}
+              onCodeChange={handleCodeChange}
+            />
+          )}
+        </div>
       </div>
     </div>
   );
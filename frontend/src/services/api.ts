@@ -2,7 +2,14 @@
  * API service for making HTTP requests to the backend
  */
 import axios from 'axios';
-import type { RoomResponse, Room, AutocompleteRequest, AutocompleteResponse } from '../types';
+import type {
+  RoomResponse,
+  Room,
+  RoomFile,
+  AutocompleteRequest,
+  AutocompleteResponse,
+  AutocompleteChunk,
+} from '../types';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -29,6 +36,21 @@ export const roomsApi = {
     const response = await api.get<Room>(`/rooms/${roomId}`);
     return response.data;
   },
+
+  /**
+   * Create a file in a room
+   */
+  createFile: async (roomId: string, path: string): Promise<RoomFile> => {
+    const response = await api.post<RoomFile>(`/rooms/${roomId}/files`, { path });
+    return response.data;
+  },
+
+  /**
+   * Delete a file from a room
+   */
+  deleteFile: async (roomId: string, fileId: string): Promise<void> => {
+    await api.delete(`/rooms/${roomId}/files/${fileId}`);
+  },
 };
 
 export const autocompleteApi = {
@@ -39,6 +61,52 @@ export const autocompleteApi = {
     const response = await api.post<AutocompleteResponse>('/autocomplete', request);
     return response.data;
   },
+
+  /**
+   * Stream an autocomplete suggestion, calling onChunk for each partial frame.
+   * Abort the signal to cancel mid-stream; the server stops generating as soon
+   * as the connection closes.
+   */
+  streamSuggestion: async (
+    request: AutocompleteRequest,
+    onChunk: (chunk: AutocompleteChunk) => void,
+    signal?: AbortSignal,
+  ): Promise<void> => {
+    const response = await fetch(`${API_BASE_URL}/autocomplete/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(request),
+      signal,
+    });
+
+    if (!response.ok || !response.body) {
+      throw new Error(`Autocomplete stream failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    try {
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop() ?? '';
+
+        for (const event of events) {
+          if (!event.startsWith('data: ')) continue;
+          const chunk: AutocompleteChunk = JSON.parse(event.slice(6));
+          onChunk(chunk);
+          if (chunk.done) return;
+        }
+      }
+    } finally {
+      await reader.cancel();
+    }
+  },
 };
 
 export default api;
@@ -11,6 +11,9 @@ export class WebSocketService {
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000;
+  private maxReconnectDelay = 30000;
+  // Reconnect delay requested by the server via server_draining/server_busy
+  private serverReconnectDelay: number | null = null;
   private messageHandlers: ((message: WebSocketMessage) => void)[] = [];
 
   /**
@@ -33,6 +36,12 @@ export class WebSocketService {
         this.ws.onmessage = (event) => {
           try {
             const message: WebSocketMessage = JSON.parse(event.data);
+            if (
+              (message.type === 'server_draining' || message.type === 'server_busy') &&
+              message.reconnect_delay_ms !== undefined
+            ) {
+              this.serverReconnectDelay = message.reconnect_delay_ms;
+            }
             this.handleMessage(message);
           } catch (error) {
             console.error('Error parsing WebSocket message:', error);
@@ -56,19 +65,36 @@ export class WebSocketService {
   }
 
   /**
-   * Handle reconnection logic
+   * Handle reconnection logic.
+   *
+   * Uses the delay the server asked for when it is draining or shedding load,
+   * otherwise exponential backoff with full jitter so clients spread out
+   * instead of reconnecting in lockstep.
    */
   private handleReconnect() {
-    if (this.reconnectAttempts < this.maxReconnectAttempts && this.roomId) {
-      this.reconnectAttempts++;
-      console.log(`Reconnecting... Attempt ${this.reconnectAttempts}`);
+    if (!this.roomId) return;
 
-      setTimeout(() => {
-        if (this.roomId) {
-          this.connect(this.roomId);
-        }
-      }, this.reconnectDelay * this.reconnectAttempts);
+    let delay: number;
+    if (this.serverReconnectDelay !== null) {
+      delay = this.serverReconnectDelay;
+      this.serverReconnectDelay = null;
+    } else if (this.reconnectAttempts < this.maxReconnectAttempts) {
+      this.reconnectAttempts++;
+      const cap = Math.min(this.maxReconnectDelay, this.reconnectDelay * 2 ** this.reconnectAttempts);
+      delay = Math.random() * cap;
+    } else {
+      return;
     }
+
+    console.log(`Reconnecting in ${Math.round(delay)}ms... Attempt ${this.reconnectAttempts}`);
+
+    setTimeout(() => {
+      if (this.roomId) {
+        this.connect(this.roomId).catch((error) => {
+          console.error('Reconnect failed:', error);
+        });
+      }
+    }, delay);
   }
 
   /**
@@ -83,16 +109,28 @@ export class WebSocketService {
   }
 
   /**
-   * Send code update
+   * Send code update for a file
    */
-  sendCodeUpdate(code: string, userId?: string) {
+  sendCodeUpdate(code: string, fileId: string | null, userId?: string) {
     this.send({
       type: 'code_update',
+      file_id: fileId ?? undefined,
       code,
       user_id: userId,
     });
   }
 
+  /**
+   * Open a file; the server replies with file_opened and only sends
+   * edits and cursors for this file from then on
+   */
+  openFile(fileId: string) {
+    this.send({
+      type: 'open_file',
+      file_id: fileId,
+    });
+  }
+
   /**
    * Send cursor position
    */
@@ -2,9 +2,11 @@
  * Redux slice for code editor state management
  */
 import { createSlice, PayloadAction } from '@reduxjs/toolkit';
-import type { CodeEditorState } from '../types';
+import type { CodeEditorState, RoomFile } from '../types';
 
 const initialState: CodeEditorState = {
+  files: [],
+  activeFileId: null,
   code: '# Start coding here...\n',
   language: 'python',
   cursorPosition: 0,
@@ -22,6 +24,25 @@ const editorSlice = createSlice({
     setLanguage: (state, action: PayloadAction<string>) => {
       state.language = action.payload;
     },
+    setFiles: (state, action: PayloadAction<RoomFile[]>) => {
+      state.files = action.payload;
+    },
+    addFile: (state, action: PayloadAction<RoomFile>) => {
+      if (!state.files.some(f => f.id === action.payload.id)) {
+        state.files.push(action.payload);
+        state.files.sort((a, b) => a.path.localeCompare(b.path));
+      }
+    },
+    removeFile: (state, action: PayloadAction<string>) => {
+      state.files = state.files.filter(f => f.id !== action.payload);
+    },
+    setActiveFile: (state, action: PayloadAction<{ fileId: string; code: string; language?: string }>) => {
+      state.activeFileId = action.payload.fileId;
+      state.code = action.payload.code;
+      if (action.payload.language) {
+        state.language = action.payload.language;
+      }
+    },
     setCursorPosition: (state, action: PayloadAction<number>) => {
       state.cursorPosition = action.payload;
     },
@@ -40,6 +61,10 @@ const editorSlice = createSlice({
 export const {
   setCode,
   setLanguage,
+  setFiles,
+  addFile,
+  removeFile,
+  setActiveFile,
   setCursorPosition,
   setConnected,
   setActiveUsers,
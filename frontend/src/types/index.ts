@@ -2,12 +2,18 @@
  * Type definitions for the application
  */
 
+export interface RoomFile {
+  id: string;
+  path: string;
+  language: string;
+}
+
 export interface Room {
   id: string;
-  code: string;
   language: string;
   created_at: string;
   active_users: number;
+  files: RoomFile[];
 }
 
 export interface RoomResponse {
@@ -26,18 +32,47 @@ export interface AutocompleteResponse {
   end_position: number;
 }
 
+export interface AutocompleteChunk {
+  delta: string;
+  start_position: number;
+  end_position: number;
+  done: boolean;
+}
+
 export interface WebSocketMessage {
-  type: 'init' | 'code_update' | 'cursor_position' | 'user_joined' | 'user_left' | 'pong';
+  type:
+    | 'init'
+    | 'open_file'
+    | 'file_opened'
+    | 'file_created'
+    | 'file_deleted'
+    | 'error'
+    | 'code_update'
+    | 'cursor_position'
+    | 'user_joined'
+    | 'user_left'
+    | 'ping'
+    | 'pong'
+    | 'server_draining'
+    | 'server_busy';
   code?: string;
   language?: string;
+  files?: RoomFile[];
+  file?: RoomFile;
+  file_id?: string;
+  path?: string;
+  detail?: string;
   active_users?: number;
   user_id?: string;
   position?: number;
   line?: number;
   column?: number;
+  reconnect_delay_ms?: number;
 }
 
 export interface CodeEditorState {
+  files: RoomFile[];
+  activeFileId: string | null;
   code: string;
   language: string;
   cursorPosition: number;